@@ -6,7 +6,9 @@
 # license information, please view the LICENSE file that was distributed with
 # this source code.
 
-from typing import Callable, TypeVar
+import itertools
+import operator
+from typing import Any, Callable, TypeVar
 
 from .item import Item
 
@@ -39,16 +41,51 @@ class Bucket(list[T]):
 
         :returns: A bucket list of items matching the ``filter``.
         """
-        # Iterate over the list of items to match them against the filter. If
-        # the filter matches, the item will be added to the return bucket and
-        # removed from the original list.
-        #
-        # NOTE: A copy of the list is used, as iterating the list won't work
-        #       reliable, if items are removed from it while iterating.
-        temp: Bucket = self.__class__()
-        for item in self.copy():
-            if filter(item):
-                temp.append(item)
-                self.remove(item)
-
-        return temp
+        # Match each item against the filter exactly once and partition the
+        # items into matched and kept ones based on the resulting flags. Both
+        # 'map' and 'itertools.compress' iterate entirely within the C layer,
+        # avoiding per-item bytecode dispatch of a Python-level loop and the
+        # second predicate evaluation a pair of comprehensions would cost.
+        flags = list(map(filter, self))
+        matched: Bucket = self.__class__(itertools.compress(self, flags))
+        kept = list(itertools.compress(self, map(operator.not_, flags)))
+
+        # Replace the contents of this bucket with the items not matching the
+        # filter. Using slice assignment alters the list in place, so external
+        # references to this bucket stay valid.
+        self[:] = kept
+        return matched
+
+    # Cache of the attribute getters used by 'fetchBy'. As the set of
+    # attributes queried by templates is small and recurring, the getters are
+    # shared across all buckets and built just once per attribute name.
+    _attrGetters: dict = {}
+
+    def fetchBy(self, attr: str, value: Any) -> 'Bucket':
+        """
+        Query the list for items whose ``attr`` equals ``value`` and pop them.
+
+        This method is a specialization of :py:meth:`fetch` for the common
+        case of filtering by a single attribute. Instead of invoking a Python
+        filter function for every item, the attribute is extracted with a
+        cached :py:class:`operator.attrgetter`, which runs at C speed and
+        avoids the per-item call overhead.
+
+
+        :param attr: Name of the item attribute to compare. Dotted paths are
+            supported, as defined by :py:class:`operator.attrgetter`.
+        :param value: The value the attribute needs to be equal to.
+
+        :returns: A bucket list of items matching the criteria.
+        """
+        getter = self._attrGetters.get(attr)
+        if getter is None:
+            getter = Bucket._attrGetters[attr] = operator.attrgetter(attr)
+
+        # Partition the items just like 'fetch' does, but with the attribute
+        # comparison inlined into the flag comprehension instead of going
+        # through a filter callable per item.
+        flags = [getter(x) == value for x in self]
+        matched: Bucket = self.__class__(itertools.compress(self, flags))
+        self[:] = list(itertools.compress(self, map(operator.not_, flags)))
+        return matched
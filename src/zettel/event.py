@@ -7,11 +7,43 @@
 # this source code.
 
 import datetime
-from typing import Optional, Union
+from typing import Optional, Sequence, Union
 
 from .item import Item, Priority
 
 
+# The boundary times of a day. Both are constants, so they're resolved once at
+# import instead of walking the datetime attribute chain on every conversion.
+_MIN_TIME = datetime.datetime.min.time()
+_MAX_TIME = datetime.datetime.max.time()
+
+
+def _dateToDateTime(d: datetime.date, end: bool) -> datetime.datetime:
+    """
+    Convert a plain :py:class:`datetime.date` into :py:class:`datetime.datetime`.
+
+    The given date will be merged with either the minimum time of a day, or
+    the maximum, if an end timestamp should be generated.
+
+
+    :param d: The :py:class:`datetime.date` object to convert.
+    :param end: Whether this timestamp should represent the end of a day.
+
+    :returns: The converted, still naive :py:class:`datetime.datetime` object.
+    """
+    return datetime.datetime.combine(d, _MAX_TIME if end else _MIN_TIME)
+
+
+# Dispatch table for 'Event.toDateTime', mapping the exact type of its
+# argument to the related conversion handler. A single dict lookup replaces
+# per-call type checks on the hot conversion path. Backend-specific subclasses
+# are not listed in advance, but will be added on their first occurrence.
+_TO_DATETIME = {
+    datetime.datetime: lambda d, end: d,
+    datetime.date: _dateToDateTime,
+}
+
+
 class Event(Item):
     """
     Event item.
@@ -20,6 +52,10 @@ class Event(Item):
     to represent event items, e.g. created from a calendar provider.
     """
 
+    # Just like the parent class, events declare their additional attributes
+    # as slots to avoid the per-instance dict overhead.
+    __slots__ = ('all_day', 'start', 'end')
+
     @staticmethod
     def toDateTime(d: Union[datetime.date, datetime.datetime],
                    end: bool = False,
@@ -47,27 +83,24 @@ class Event(Item):
 
         :returns: The converted :py:class:`datetime.datetime` object.
         """
-        return (
-            # If 'd' already is a datetime object, it can be used for further
-            # processing without converting.
-            d if isinstance(d, datetime.datetime)
-
-            # Otherwise it is assumed, 'd' is just a date object without time
-            # information. Therefore, this date will be merged with either the
-            # minimum time of a day, or the maximum, if an end timestamp should
-            # be generated.
-            else datetime.datetime.combine(
-                d,
-                (datetime.datetime.min.time() if not end
-                 else datetime.datetime.max.time()))
-
-            # Finally, apply the desired timezone to the original or generated
-            # datetime object. If no timezone has been defined, the system's
-            # default timezone will be used.
-        ).astimezone(tz=tzinfo)
+        # Select the conversion handler matching the exact type of 'd'. For
+        # types not in the dispatch table yet (i.e. datetime subclasses some
+        # backends return), the probe for the 'hour' attribute decides which
+        # handler applies and memoizes it for subsequent calls.
+        handler = _TO_DATETIME.get(type(d))
+        if handler is None:
+            handler = _TO_DATETIME[type(d)] = _TO_DATETIME[
+                datetime.datetime if hasattr(d, 'hour') else datetime.date]
+
+        # Finally, apply the desired timezone to the original or generated
+        # datetime object. If no timezone has been defined, the system's
+        # default timezone will be used.
+        return handler(d, end).astimezone(tz=tzinfo)
 
     @staticmethod
-    def _isToday(d: Union[datetime.date, datetime.datetime]) -> bool:
+    def _isToday(d: Union[datetime.date, datetime.datetime],
+                 today: Optional[datetime.date] = None
+                 ) -> bool:
         """
         Check if a specific date matches today's date.
 
@@ -77,9 +110,17 @@ class Event(Item):
 
 
         :param d: The :py:class:`datetime.date` object to be checked.
+        :param today: Today's date. Callers checking multiple dates should
+            look up :py:meth:`datetime.date.today` once and pass it via this
+            parameter to avoid repeated system time queries.
         """
-        return ((d.date() if isinstance(d, datetime.datetime) else d)
-                == datetime.date.today())
+        return ((d.date() if hasattr(d, 'hour') else d)
+                == (today if today is not None else datetime.date.today()))
+
+    # Cache for the timestamps generated by 'timeToday'. As these timestamps
+    # are identical for all events handled within a single day, they will be
+    # computed just once per day (and timezone) and reused afterwards.
+    _timeTodayCache: dict = {}
 
     @classmethod
     def timeToday(cls,
@@ -92,6 +133,10 @@ class Event(Item):
         For today's date, this method gets either the minimum date and time
         (midnight) or the maximum (just before midnight).
 
+        .. note:: As these timestamps are constant within a day, they're
+            computed just once and cached, avoiding repeated timezone
+            conversions when processing many events.
+
 
         :param end: Whether the timestamp should represent the end of the day.
         :param tzinfo: Optional timezone information to use. If :py:class:`None`
@@ -100,7 +145,14 @@ class Event(Item):
         :returns: The :py:class:`datetime.datetime` object matching the criteria
             defined via parameters.
         """
-        return cls.toDateTime(datetime.date.today(), end, tzinfo)
+        # Keying the cache by today's date implicitly invalidates outdated
+        # entries at midnight, while the remaining key components distinguish
+        # the start and end timestamps of a day for specific timezones.
+        key = (datetime.date.today(), end, tzinfo)
+        cached = cls._timeTodayCache.get(key)
+        if cached is None:
+            cached = cls._timeTodayCache[key] = cls.toDateTime(*key)
+        return cached
 
     def __init__(self,
                  name: str,
@@ -108,7 +160,7 @@ class Event(Item):
                  end: datetime.datetime,
                  all_day: bool = False,
                  priority: Optional[Priority] = None,
-                 tags: Optional[list[str]] = None
+                 tags: Optional[Sequence[str]] = None
                  ) -> None:
         """
         Constructor.
@@ -125,35 +177,25 @@ class Event(Item):
         :param tags: A list of tags, by which this event and other items could
             be grouped or filtered.
         """
-        self._start = start
-        self._end = end
-
         # Flag the event as 'all day' not even just if the related parameter is
         # set, but for meetings spanning multiple days, as these are all day
-        # from today's perspective, too.
-        self.all_day = all_day or (not self._isToday(start)
-                                   and not self._isToday(end))
+        # from today's perspective, too. Today's date is looked up just once
+        # and reused for both checks, as it won't change while constructing.
+        # Thanks to boolean short-circuiting, the end date is only checked if
+        # the start date didn't match today already.
+        today = datetime.date.today()
+        self.all_day = all_day or not (self._isToday(start, today)
+                                       or self._isToday(end, today))
+
+        # For events spanning multiple days, the start and end timestamps will
+        # be capped to today's boundaries, so they're at least midnight and at
+        # most just before midnight of today. As printers tend to read these
+        # attributes multiple times, they're computed once instead of being
+        # recalculated in properties on every access.
+        self.start = start if self._isToday(start, today) else self.timeToday()
+        self.end = (end if self._isToday(end, today)
+                    else self.timeToday(True))
 
         # As an event is basically just an item with additional attributes, the
         # remaining ones will be saved by initializing the parent class.
         super().__init__(name, priority, tags)
-
-    @property
-    def start(self) -> datetime.datetime:
-        """
-        Get the event's start time.
-
-        This method returns the start timestamp of this event. For events
-        spanning multiple days, it will be at least midnight of today.
-        """
-        return self._start if self._isToday(self._start) else self.timeToday()
-
-    @property
-    def end(self) -> datetime.datetime:
-        """
-        Get the event's end time.
-
-        This method returns the end timestamp of this event. For events spanning
-        multiple days, it will be at most midnight of today.
-        """
-        return self._end if self._isToday(self._end) else self.timeToday(True)
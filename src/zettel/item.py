@@ -7,7 +7,7 @@
 # this source code.
 
 from enum import IntEnum
-from typing import Optional
+from typing import Optional, Sequence
 
 
 class Priority(IntEnum):
@@ -34,10 +34,15 @@ class Item:
     representation layer some form of abstraction.
     """
 
+    # Items are plain data holders created in large numbers, so their
+    # attributes are declared as slots. This drops the per-instance dict,
+    # shrinking the memory footprint and speeding up attribute access.
+    __slots__ = ('name', 'priority', 'tags', '_priority_value')
+
     def __init__(self,
                  name: str,
                  priority: Optional[Priority] = None,
-                 tags: Optional[list[str]] = None
+                 tags: Optional[Sequence[str]] = None
                  ) -> None:
         """
         Constructor.
@@ -51,3 +56,9 @@ class Item:
         self.name = name
         self.priority = priority
         self.tags = tags
+
+        # Comparing Priority enum members dispatches through the enum wrapper,
+        # which is noticeably slower than comparing plain integers. Therefore,
+        # the raw priority value is unwrapped once on construction for sort and
+        # filter heavy code paths, while the enum stays the public interface.
+        self._priority_value = int(priority) if priority is not None else 0
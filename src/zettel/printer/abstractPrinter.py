@@ -7,10 +7,9 @@
 # this source code.
 
 import abc
-import contextlib
 
 
-class AbstractPrinter(contextlib.AbstractContextManager):
+class AbstractPrinter(abc.ABC):
     """
     Abstract printing class.
 
@@ -25,6 +24,17 @@ class AbstractPrinter(contextlib.AbstractContextManager):
     interface to format the printed text.
     """
 
+    def __enter__(self) -> 'AbstractPrinter':
+        """
+        Method run when entering the context manager.
+
+        This method just returns the printer itself. Defining it directly on
+        this class instead of inheriting it from
+        :py:class:`contextlib.AbstractContextManager` skips the ABC machinery
+        of the latter on every context entry.
+        """
+        return self
+
     def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
         """
         Method run when leaving the context manager.
@@ -12,6 +12,48 @@ import zettel
 from contextlib import contextmanager, nullcontext
 
 
+class _StyleContext:
+    """
+    Reusable context manager for a fixed set of format parameters.
+
+    This class provides the same behaviour as wrapping :py:meth:`Printer._set`
+    with a ``with`` block, but as a plain object that can be created once per
+    style and reused. This avoids allocating a new generator object for each
+    use of a style, which adds up when formatting many items.
+    """
+
+    __slots__ = ('_printer', '_kwargs', '_saved')
+
+    def __init__(self, printer: 'Printer', **kwargs) -> None:
+        """
+        Constructor.
+
+
+        :param printer: The printer to set the format parameters on.
+        :param kwargs: The format parameters this style applies. See the
+            documentation of ``set()`` from ``python-escpos`` for allowed
+            arguments.
+        """
+        self._printer = printer
+        self._kwargs = kwargs
+
+        # Parameter states saved on entering the context, so they can be
+        # restored on exit. A stack is used instead of a single slot to keep
+        # this context manager reentrant for nested styles.
+        self._saved: list = []
+
+    def __enter__(self) -> None:
+        printer = self._printer
+        self._saved.append(printer._param)
+        printer._param = {**printer._param, **self._kwargs}
+        printer._printer.set(**printer._param)
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        printer = self._printer
+        printer._param = self._saved.pop()
+        printer._printer.set(**printer._param)
+
+
 class Printer(zettel.AbstractPrinter):
     """
     ESC/POS printer.
@@ -50,6 +92,20 @@ class Printer(zettel.AbstractPrinter):
         # related format methods of this class.
         self._param: dict = {}
 
+        # The format styles available via the printer interface are fixed, so
+        # their context managers can be allocated once and reused for every
+        # 'with' block instead of creating a fresh one per use.
+        self._center = _StyleContext(self, align='center')
+        self._bold = _StyleContext(self, bold=True)
+        self._underline = _StyleContext(self, underline=True)
+        self._highlight = _StyleContext(self, invert=True)
+
+        # Creating a 'textwrap.TextWrapper' compiles its regular expressions,
+        # which is too expensive to repeat for every line printed. Therefore,
+        # the wrappers will be created once per required line length and cached
+        # in the following dictionary for reuse.
+        self._wrappers: dict = {}
+
     def __exit__(self,  exc_type, exc_value, exc_traceback) -> None:
         """
         Exit the printing context.
@@ -131,18 +187,21 @@ class Printer(zettel.AbstractPrinter):
         # the 'double_width' format parameter is set, the half width will be
         # used instead automatically.
         width = (self._width if not self._param.get('double_width')
-                 else (self._width / 2))
-        lines = textwrap.wrap(s, (width - len(prefix)))
-
-        # Print the first line including the prefix. Then, if the text exceeds a
-        # single line, following lines will be printed with an indentation
-        # matching the prefix length.
-        if not skip_prefix:
-            self._printer.text(prefix)
-        self._printer.text(f'{lines[0]}{end}')
-        for l in lines[1:]:
-            self._printer.text(''.ljust(len(prefix)))
-            self._printer.text(f'{l}{end}')
+                 else (self._width / 2)) - len(prefix)
+        wrapper = self._wrappers.get(width)
+        if wrapper is None:
+            wrapper = self._wrappers[width] = textwrap.TextWrapper(width=width)
+        lines = wrapper.wrap(s)
+
+        # Assemble the first line including the prefix and, if the text exceeds
+        # a single line, following lines with an indentation matching the
+        # prefix length. The whole block is handed to the backend driver in a
+        # single call, as each call translates to a write on the slow printer
+        # transport and batching avoids a device round-trip per line.
+        pad = ' ' * len(prefix)
+        self._printer.text(('' if skip_prefix else prefix)
+                           + f'{lines[0]}{end}'
+                           + ''.join(f'{pad}{l}{end}' for l in lines[1:]))
 
     def heading(self, s: str, large: bool = True) -> None:
         """
@@ -161,25 +220,17 @@ class Printer(zettel.AbstractPrinter):
         if large:
             self.blank()
 
-    @contextmanager
     def center(self):
-        with self._set(align='center'):
-            yield
+        return self._center
 
-    @contextmanager
     def bold(self):
-        with self._set(bold=True):
-            yield
+        return self._bold
 
-    @contextmanager
     def underline(self):
-        with self._set(underline=True):
-            yield
+        return self._underline
 
-    @contextmanager
     def highlight(self):
-        with self._set(invert=True):
-            yield
+        return self._highlight
 
     def listItem(self, s: str, checkbox: bool = False) -> None:
         self.text(s, prefix=('- ' if not checkbox else '[ ] '))
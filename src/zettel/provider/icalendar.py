@@ -11,6 +11,7 @@ import datetime
 import icalendar
 import requests
 import zettel
+from typing import Optional
 
 
 class Provider(zettel.AbstractProvider):
@@ -30,8 +31,15 @@ class Provider(zettel.AbstractProvider):
         """
         self._url = url
 
+        # Use a session for fetching the feed instead of one-shot requests. It
+        # keeps the TCP and TLS connection state alive between calls, so
+        # fetching the same feed multiple times doesn't pay the connection
+        # handshake again.
+        self._session = requests.Session()
+
     @staticmethod
-    def toZettelEvents(calendar: collections.abc.Iterable[icalendar.cal.Event]
+    def toZettelEvents(calendar: collections.abc.Iterable[icalendar.cal.Event],
+                       today: Optional[datetime.date] = None
                        ) -> zettel.Event:
         """
         Convert a list of iCalendar events to Zettel events.
@@ -43,16 +51,48 @@ class Provider(zettel.AbstractProvider):
 
 
         :param calendar: A list of iCalendar events.
+        :param today: If a date is passed, only events visible in the schedule
+            of this date will be converted. Filtering on the raw timestamps
+            skips the conversion and object construction for all events
+            dropped anyway, which is the vast majority for year-long feeds.
 
         :returns: An iterable list of :py:class:`.Event` objects, representing
             the related ``calendar`` events.
         """
+        # Bind the names used on every iteration to locals once, as the loop
+        # below would resolve them through module and attribute lookups for
+        # each event otherwise.
+        _datetime = datetime.datetime
+        _oneDay = datetime.timedelta(1)
+        _toDateTime = zettel.Event.toDateTime
+
         for event in calendar:
             # Decode the start and end timestamps of the event. These will be
             # used several times and therefore cached in these variables.
             a = event.decoded('DTSTART')
             b = event.decoded('DTEND')
 
+            # Check the type of the decoded timestamps once. Per RFC 5545 the
+            # start and end of an event are either both dates or both
+            # datetimes, so a single check on the start timestamp decides
+            # whether this is an 'all day' event.
+            all_day = not isinstance(a, _datetime)
+            b_hasTime = isinstance(b, _datetime)
+
+            # If a date to filter for has been passed, check the start and end
+            # dates against it before constructing any Zettel event. As the
+            # feed's timestamps may carry a foreign timezone, datetimes are
+            # converted to the local timezone first, so events near day
+            # boundaries are judged by the same dates the rest of Zettel will
+            # use. For 'all day' events the end date is exclusive and needs to
+            # be shifted by one day, just as in the conversion below.
+            if today is not None:
+                if not ((a if all_day else a.astimezone().date())
+                        <= today <=
+                        (b.astimezone().date() if b_hasTime
+                         else b - _oneDay)):
+                    continue
+
             # Create a new Zettel Event and yield it back to the calle to make
             # the results of this function call iterable. Its arguments need to
             # be converted to standardized ones, useable by other components of
@@ -64,15 +104,9 @@ class Provider(zettel.AbstractProvider):
                 # 'all day' events, these will be date objects, where the end
                 # date exceeds the real date by one day. Therefore, it will be
                 # substracted before converting it.
-                zettel.Event.toDateTime(a),
-                zettel.Event.toDateTime((b if isinstance(b, datetime.datetime)
-                                         else b - datetime.timedelta(1)),
-                                        True),
-
-                # If both start and end date are just dates without time, this
-                # event is an 'all day' event.
-                not (isinstance(a, datetime.datetime)
-                     and isinstance(b, datetime.datetime))
+                _toDateTime(a),
+                _toDateTime((b if b_hasTime else b - _oneDay), True),
+                all_day
             )
 
     def fetch(self) -> collections.abc.Iterable[zettel.Task]:
@@ -86,22 +120,25 @@ class Provider(zettel.AbstractProvider):
         :returns: An iterable list of :py:class:`.Event` objects, representing
             the related events of the iCalendar feed.
         """
-        # Retrieve the iCalendar feed from a remote server and parse its
-        # contents as complete calendar.
-        feed = requests.get(self._url).text
-        ical = icalendar.cal.Calendar.from_ical(feed)
-
-        yield from filter(
-            # The iCalendar feed may contain any number of events. However,
-            # Zettel is interested in today's events only, so these should be
-            # filtered to return today's selection of events only.
-            lambda e: (e._start.date() <= datetime.date.today()
-                       and e._end.date() >= datetime.date.today()),
-
-            # To feed the filter above, convert just the iCalendar events into
-            # Zettel events by passing a filtered subset of iCalendar items to
-            # the conversion method.
-            self.toZettelEvents(filter(
-                lambda e: isinstance(e, icalendar.cal.Event),
-                ical.walk()
-            )))
+        # Retrieve the iCalendar feed from a remote server. The status of the
+        # response is checked before touching its body, so error responses
+        # fail cheaply instead of being decoded and parsed first, and the
+        # timeout avoids a stalling feed blocking the whole pipeline.
+        response = self._session.get(self._url, timeout=10)
+        response.raise_for_status()
+
+        # Parse the feed's contents as complete calendar. The raw response
+        # bytes are handed to the parser directly, as it decodes them itself.
+        # This skips decoding the whole feed into an intermediate string
+        # first, halving the peak memory needed for large feeds.
+        ical = icalendar.cal.Calendar.from_ical(response.content)
+
+        # The iCalendar feed may contain any number of events. However, Zettel
+        # is interested in today's events only, so the conversion is limited
+        # to today's selection of events right away, discarding all others
+        # before they're converted. Selecting the events by component name
+        # lets the library skip all other components (timezones, alarms,
+        # todos) internally, instead of discarding them with a per-component
+        # type check afterwards.
+        yield from self.toZettelEvents(ical.walk('VEVENT'),
+                                       datetime.date.today())
@@ -9,6 +9,7 @@
 import collections.abc
 import datetime
 import jira
+import string
 import zettel
 from typing import Optional, Union
 
@@ -46,6 +47,23 @@ class Provider(zettel.AbstractProvider):
         self._priorities = {k: self._convertPriority(v)
                             for k, v in priorities.items()}
 
+        # Bind the format string's format method once, so building a task name
+        # doesn't pay the attribute lookup and bound-method allocation for
+        # every issue again.
+        self._formatName = format.format
+
+        # Determine the issue fields to be requested from the JIRA server.
+        # Besides the fields needed for building a task below, the format
+        # string may reference arbitrary issue fields, so these are extracted
+        # from its replacement fields and merged into the projection to keep
+        # custom formats working.
+        fields = {'summary', 'priority', 'project', 'labels', 'duedate'}
+        fields.update(
+            name.split('.')[2]
+            for _, name, _, _ in string.Formatter().parse(format)
+            if name and name.startswith('i.fields.'))
+        self._fields = ','.join(sorted(fields))
+
         # Initialize the connection to the given JIRA server with the remaining
         # arguments passed to this constructor. Usually it would be sufficient
         # to open it just before querying the API in the 'fetch()' method.
@@ -77,11 +95,13 @@ class Provider(zettel.AbstractProvider):
         :returns: If ``datestr`` is not :py:class:`None`, the converted date
             will be returned. Otherwise the date keeps being :py:class:`None`.
         """
-        return (datetime.datetime.strptime(datestr, "%Y-%m-%d").date()
-                if datestr else None)
+        # JIRA returns due dates in ISO 8601 format, which can be parsed by
+        # the C-implemented 'fromisoformat' instead of 'strptime', avoiding
+        # the interpretation of a format string for every issue.
+        return datetime.date.fromisoformat(datestr) if datestr else None
 
     @staticmethod
-    def _getTags(issue: jira.resources.Issue) -> list[str]:
+    def _getTags(issue: jira.resources.Issue) -> tuple[str, ...]:
         """
         Get tags assigned to a specific ``issue``.
 
@@ -91,17 +111,23 @@ class Provider(zettel.AbstractProvider):
         :returns: A default set of tags will be assigned to every issue, which
             includes the generic word `JIRA` and the key of the issue's project.
             If the issue type supports labels and has at least one assigned, the
-            list of labels will be merged to the tag list.
+            deduplicated list of labels will be merged to the tag list.
         """
-        return [
+        # Track the tags seen so far in a set, so labels repeating the default
+        # tags or each other end up in the result just once. A tuple is
+        # returned instead of a list, as the tags won't be mutated afterwards
+        # and tuples are more compact.
+        seen = {'JIRA', issue.fields.project.key}
+        return (
             'JIRA',
             issue.fields.project.key,
 
             # Merge the list of labels to the tag list. However, if the type of
-            # issue doesn't support labels, just an empty list will be merged to
-            # avoid compiler errors.
-            *(getattr(issue.fields, 'labels', []))
-        ]
+            # issue doesn't support labels, just an empty tuple will be merged
+            # to avoid compiler errors.
+            *(l for l in getattr(issue.fields, 'labels', ())
+              if not (l in seen or seen.add(l)))
+        )
 
     def fetch(self) -> collections.abc.Iterable[zettel.Task]:
         """
@@ -122,9 +148,16 @@ class Provider(zettel.AbstractProvider):
         # NOTE: This call tries to get ALL issues matching the filter. Therefore
         #       it should be set appropriate to match open issues with relevance
         #       only.
-        for issue in self._jira.search_issues(self._filter, maxResults=False):
+        #
+        # NOTE: The query is restricted to the fields required for building the
+        #       tasks, including the ones referenced by the format string, as
+        #       determined in the constructor. This cuts the payload to
+        #       transfer and parse per issue drastically.
+        for issue in self._jira.search_issues(self._filter,
+                                              maxResults=False,
+                                              fields=self._fields):
             yield zettel.Task(
-                self._format.format(i=issue),
+                self._formatName(i=issue),
                 self._parsePriority(issue.fields.priority.name),
                 self._getTags(issue),
                 self._parseDate(issue.fields.duedate)
@@ -7,7 +7,7 @@
 # this source code.
 
 from datetime import date
-from typing import Optional
+from typing import Optional, Sequence
 
 from .item import Item, Priority
 
@@ -21,10 +21,14 @@ class Task(Item):
     other kind of task.
     """
 
+    # Just like the parent class, tasks declare their additional attributes as
+    # slots to avoid the per-instance dict overhead.
+    __slots__ = ('due',)
+
     def __init__(self,
                  name: str,
                  priority: Optional[Priority] = None,
-                 tags: Optional[list[str]] = None,
+                 tags: Optional[Sequence[str]] = None,
                  due: Optional[date] = None
                  ) -> None:
         """
@@ -9,7 +9,6 @@
 import babel.dates
 import datetime
 import zettel
-from typing import Callable
 
 
 # Internationalization dictionary, containing all messages of this template in
@@ -38,6 +37,17 @@ messages = {
 }
 
 
+# The locale and datetime pattern used for the timestamp in the header. Babel
+# resolves the locale's short date and time skeletons on every call to its
+# 'format_datetime' otherwise, so the combined pattern is compiled just once
+# at import and merely applied when printing.
+_LOCALE = babel.Locale.default('LC_TIME')
+_DATETIME_PATTERN = babel.dates.parse_pattern(
+    babel.dates.get_datetime_format('short', locale=_LOCALE)
+    .replace('{0}', babel.dates.get_time_format('short', locale=_LOCALE).pattern)
+    .replace('{1}', babel.dates.get_date_format('short', locale=_LOCALE).pattern))
+
+
 def trans(lang: str, key: str) -> str:
     """
     Get translated message for a specific key.
@@ -55,22 +65,42 @@ def trans(lang: str, key: str) -> str:
     return messages[lang].get(key, messages['en'][key])
 
 
+def _taskSortKey(t: zettel.Task,
+                 _medium: int = zettel.Priority.MEDIUM.value,
+                 _dateMax: datetime.date = datetime.date.max) -> tuple:
+    """
+    Sort key ordering tasks by descending priority and ascending due date.
+
+    Negating the priority value yields the descending order, while the maximum
+    date acts as sentinel for tasks without a due date. The fallback constants
+    are bound as default arguments, so they're resolved as locals instead of
+    globals on every call. Defining the key at module level also avoids
+    allocating a fresh closure per template invocation.
+
+
+    :param t: The task to compute the sort key for.
+
+    :returns: The tuple to sort the task by.
+    """
+    return (-(t._priority_value or _medium), t.due or _dateMax)
+
+
 def printTemplate(bucket: zettel.Bucket,
                   p: zettel.AbstractPrinter,
                   lang: str = 'en'
                   ):
-    # Define a shortcut function to avoid passing the 'lang' argument on every
-    # message lookup call.
-    def m(key: str) -> str:
-        return trans(lang, key)
+    # Build the message table for the selected language once by merging it
+    # over the english fallbacks. Message lookups thereby become a single dict
+    # access instead of dispatching through a Python-level helper function
+    # resolving the fallback on every call.
+    m = {**messages['en'], **messages.get(lang, {})}.__getitem__
 
     # ======
     # Header
     # ======
 
     with p.center():
-        p.text(babel.dates.format_datetime(datetime.datetime.now(),
-                                           format='short'))
+        p.text(_DATETIME_PATTERN.apply(datetime.datetime.now(), _LOCALE))
         p.blank()
 
     # ======
@@ -101,10 +131,10 @@ def printTemplate(bucket: zettel.Bucket,
     # Tasks
     # =====
 
-    # Use a helper function to print sections of selected tasks, matching a
-    # specific criteria. These tasks will be removed from the
-    def print_tasks(filter: Callable[[zettel.Task], bool], title: str) -> None:
-        matches = tasks.fetch(filter)
+    # Use a helper function to print sections of selected tasks. For sections
+    # without any tasks, neither the heading nor the trailing blank line will
+    # be printed.
+    def print_tasks(matches: list[zettel.Task], title: str) -> None:
         if matches:
             with p.underline():
                 p.heading(m(title), large=False)
@@ -118,17 +148,26 @@ def printTemplate(bucket: zettel.Bucket,
         lambda i: isinstance(i, zettel.Task))
     if tasks:
         # To get a list of tasks sorted by priority and within each priority by
-        # date, sort the list by these criteria in reverse order.
-        tasks.sort(key=(lambda t: t.due if t.due else datetime.date.max))
-        tasks.sort(key=(lambda t: t.priority
-                        if t.priority else zettel.Priority.MEDIUM),
-                   reverse=True)
+        # date, sort the list once with the composite key defined above.
+        tasks.sort(key=_taskSortKey)
+
+        # Partition the sorted tasks into overdue ones, tasks due today and
+        # the remaining ones in a single pass. Compared to fetching each
+        # section with its own filter, every task is touched just once and
+        # compared directly instead of through a lambda per check.
+        today = datetime.date.today()
+        overdue: list[zettel.Task] = []
+        due_today: list[zettel.Task] = []
+        later: list[zettel.Task] = []
+        for t in tasks:
+            due = t.due
+            (overdue if due and due < today
+             else due_today if due == today
+             else later).append(t)
 
         with p.center():
             p.heading(m('tasks'))
-        print_tasks(lambda t: bool(t.due and t.due < datetime.date.today()),
-                    'tasks_overdue')
-        print_tasks(lambda t: (t.due == datetime.date.today()),
-                    'tasks_today')
-        for t in tasks:
+        print_tasks(overdue, 'tasks_overdue')
+        print_tasks(due_today, 'tasks_today')
+        for t in later:
             p.listItem(t.name, checkbox=False)